@@ -1,28 +1,93 @@
 # core/content.py
 from dataclasses import dataclass
-from typing import List, Optional, Union
-from enum import Enum
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from enum import IntEnum, auto
 
 from revealpy.core.layouts import LayoutType, LayoutConfig
 
 
-class ContentType(Enum):
-    TEXT = "text"
-    BULLET_LIST = "bullet_list"
-    NUMBERED_LIST = "numbered_list"
-    EQUATION = "equation"
-    IMAGE = "image"
-    CODE = "code"
-    TABLE = "table"
-    DIAGRAM = "diagram"
-    MEDIA = "media"
-    MARKDOWN = "markdown"  # New content type
+class ContentType(IntEnum):
+    TEXT = auto()
+    BULLET_LIST = auto()
+    NUMBERED_LIST = auto()
+    EQUATION = auto()
+    IMAGE = auto()
+    CODE = auto()
+    TABLE = auto()
+    DIAGRAM = auto()
+    MEDIA = auto()
+    MARKDOWN = auto()  # New content type
 
 
-@dataclass
+_REQUIRED = object()
+
+# Field names, in tuple order, of the structured payloads built by SlideBuilder,
+# with the default used when a hand-written dict payload omits the field
+_PAYLOAD_FIELDS: Dict[ContentType, Tuple[Tuple[str, Any], ...]] = {
+    ContentType.EQUATION: (('equation', _REQUIRED), ('description', None)),
+    ContentType.IMAGE: (('url', _REQUIRED), ('caption', '')),
+    ContentType.CODE: (('code', _REQUIRED), ('language', 'python')),
+    ContentType.TABLE: (('headers', _REQUIRED), ('rows', _REQUIRED)),
+    ContentType.MEDIA: (('url', _REQUIRED), ('type', _REQUIRED)),
+}
+
+
+def unpack_payload(content_type: ContentType, value: Union[tuple, Dict[str, Any]]) -> tuple:
+    """
+    Returns a structured content payload as a tuple of its fields.
+
+    SlideBuilder stores EQUATION, IMAGE, CODE, TABLE and MEDIA payloads as
+    tuples; payloads written by hand as dicts (e.g. ``{'url': ..., 'caption': ...}``)
+    are converted to the same field order.
+
+    Args:
+        content_type (ContentType): The type of the content.
+        value (Union[tuple, Dict[str, Any]]): The content payload.
+
+    Returns:
+        tuple: The payload fields, e.g. ``(url, caption)`` for images.
+    """
+    if isinstance(value, tuple):
+        return value
+    return tuple(
+        value[name] if default is _REQUIRED else value.get(name, default)
+        for name, default in _PAYLOAD_FIELDS[content_type]
+    )
+
+
+@dataclass(frozen=True, slots=True)
 class Content:
     type: ContentType
-    value: Union[str, List[str], dict]
+    value: Union[str, List[str], tuple, Dict[str, Any]]
+
+    def payload(self) -> tuple:
+        """
+        Returns the fields of a structured payload as a tuple.
+
+        Returns:
+            tuple: See ``unpack_payload`` for the field order of each type.
+
+        Examples:
+            >>> url, caption = Content(ContentType.IMAGE, {'url': 'logo.png'}).payload()
+        """
+        return unpack_payload(self.type, self.value)
+
+    @classmethod
+    def text_batch(cls, texts: Iterable[str]) -> List['Content']:
+        """
+        Creates one TEXT content per string.
+
+        Args:
+            texts (Iterable[str]): The text of each content.
+
+        Returns:
+            List[Content]: The text contents, in order.
+
+        Examples:
+            >>> slide.add_many(Content.text_batch(["First", "Second"]))
+        """
+        text = ContentType.TEXT
+        return [cls(text, value) for value in texts]
 
 
 class SlideBuilder:
@@ -48,13 +113,32 @@ class SlideBuilder:
         ...     .add_to_column(0, Content(ContentType.TEXT, "Left content")) \\
         ...     .add_to_column(1, Content(ContentType.TEXT, "Right content"))
     """
+    __slots__ = (
+        "title", "layout", "layout_config", "contents", "_columns",
+        "is_markdown", "comparison_headers",
+    )
+
     def __init__(self, title: str, layout: LayoutType = LayoutType.TITLE_CONTENT):
-        self.title = title
-        self.layout = layout
-        self.layout_config = LayoutConfig(type=layout)
+        self.title: str = title
+        self.layout: LayoutType = layout
+        self.layout_config: LayoutConfig = LayoutConfig(type=layout)
         self.contents: List[Content] = []
-        self.columns: List[List[Content]] = [[], []]  # For two-column layouts
-        self.is_markdown = False  # New flag for markdown slides
+        # For two-column layouts; allocated on first access to columns
+        self._columns: Optional[List[List[Content]]] = None
+        self.is_markdown: bool = False  # New flag for markdown slides
+        self.comparison_headers: Tuple[str, str] = ("", "")  # Set by add_comparison
+
+    @property
+    def columns(self) -> List[List[Content]]:
+        """The contents of the left and right columns in two-column layouts."""
+        columns = self._columns
+        if columns is None:
+            columns = self._columns = [[], []]
+        return columns
+
+    @columns.setter
+    def columns(self, columns: List[List[Content]]):
+        self._columns = columns
 
     def set_layout(self, layout: LayoutType) -> 'SlideBuilder':
         """
@@ -102,13 +186,11 @@ class SlideBuilder:
             ...     extra_classes=["custom-slide", "dark-mode"]
             ... )
         """
-        self.layout_config = LayoutConfig(
-            type=self.layout,
-            title_size=title_size,
-            content_align=content_align,
-            background=background,
-            extra_classes=extra_classes or []
-        )
+        layout_config = self.layout_config
+        layout_config.title_size = title_size
+        layout_config.content_align = content_align
+        layout_config.background = background
+        layout_config.extra_classes = extra_classes or []
         return self
 
     def add_to_column(self, column: int, content: Content) -> 'SlideBuilder':
@@ -204,17 +286,11 @@ class SlideBuilder:
         return self
 
     def add_equation(self, equation: str, description: Optional[dict] = None) -> 'SlideBuilder':
-        self.contents.append(Content(ContentType.EQUATION, {
-            'equation': equation,
-            'description': description or {}
-        }))
+        self.contents.append(Content(ContentType.EQUATION, (equation, description or {})))
         return self
 
     def add_image(self, url: str, caption: Optional[str] = None) -> 'SlideBuilder':
-        self.contents.append(Content(ContentType.IMAGE, {
-            'url': url,
-            'caption': caption
-        }))
+        self.contents.append(Content(ContentType.IMAGE, (url, caption)))
         return self
 
     def add_code(self, code: str, language: str = "python") -> 'SlideBuilder':
@@ -235,17 +311,11 @@ class SlideBuilder:
             ...     print("Hello, World!")
             ... ''', language="python")
         """
-        self.contents.append(Content(ContentType.CODE, {
-            'code': code,
-            'language': language
-        }))
+        self.contents.append(Content(ContentType.CODE, (code, language)))
         return self
 
     def add_table(self, headers: List[str], rows: List[List[str]]) -> 'SlideBuilder':
-        self.contents.append(Content(ContentType.TABLE, {
-            'headers': headers,
-            'rows': rows
-        }))
+        self.contents.append(Content(ContentType.TABLE, (headers, rows)))
         return self
 
     def add_diagram(self, diagram_code: str) -> 'SlideBuilder':
@@ -262,10 +332,7 @@ class SlideBuilder:
             embed_url = f"https://www.youtube.com/embed/{video_id}"
             url = embed_url  # Substitui o URL original pelo URL de incorporação
 
-        self.contents.append(Content(ContentType.MEDIA, {
-            'url': url,
-            'type': media_type
-        }))
+        self.contents.append(Content(ContentType.MEDIA, (url, media_type)))
         return self
 
     def add_markdown(self, markdown_content: str) -> 'SlideBuilder':
@@ -284,4 +351,28 @@ class SlideBuilder:
         """
         self.is_markdown = True
         self.contents.append(Content(ContentType.MARKDOWN, markdown_content))
+        return self
+
+    def add_many(self, contents: Iterable[Content]) -> 'SlideBuilder':
+        """
+        Adds several content items to the slide at once.
+
+        Args:
+            contents (Iterable[Content]): The content items to add, in order.
+
+        Returns:
+            SlideBuilder: The slide builder instance for method chaining.
+
+        Examples:
+            >>> slide.add_many([
+            ...     Content(ContentType.TEXT, "Introduction"),
+            ...     Content(ContentType.BULLET_LIST, ["First", "Second"])
+            ... ])
+        """
+        start = len(self.contents)
+        self.contents.extend(contents)
+        if not self.is_markdown:
+            self.is_markdown = any(
+                content.type == ContentType.MARKDOWN for content in self.contents[start:]
+            )
         return self
\ No newline at end of file
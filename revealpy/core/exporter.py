@@ -1,9 +1,45 @@
 # core/exporter.py
 import os
+import secrets
+from typing import Iterable, Union
 
 class Exporter:
     @staticmethod
-    def export(filename: str, content: str):
-        os.makedirs(os.path.dirname(filename), exist_ok=True)
-        with open(filename, "w", encoding="utf-8") as f:
-            f.write(content)
+    def export(filename: str, content: Union[str, bytes]):
+        Exporter.export_stream(filename, (content,))
+
+    @staticmethod
+    def export_stream(filename: str, chunks: Iterable[Union[str, bytes]]):
+        """
+        Writes HTML to a file chunk by chunk.
+
+        Only the chunk being written has to be held in memory, so a whole
+        presentation can be exported without building it as one string.
+        Text chunks are encoded to UTF-8 once each; bytes are written as-is.
+
+        The chunks go to a temporary file next to the target, which replaces
+        the target only once every chunk has been written. If producing a chunk
+        fails, an existing file at ``filename`` is left untouched.
+
+        Args:
+            filename (str): The path of the file to write.
+            chunks (Iterable[Union[str, bytes]]): The pieces of the document, in order.
+        """
+        directory = os.path.dirname(filename)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_name = os.path.join(directory, f".{os.path.basename(filename)}.{secrets.token_hex(4)}.tmp")
+        # os.open instead of tempfile.mkstemp so the file gets the usual umask-based mode
+        fd = os.open(temp_name, os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, "O_BINARY", 0), 0o666)
+        try:
+            with open(fd, "wb", buffering=1 << 20) as f:
+                write = f.write
+                for chunk in chunks:
+                    write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+            os.replace(temp_name, filename)
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
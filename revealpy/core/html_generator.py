@@ -1,8 +1,327 @@
 # core/html_generator.py
-from typing import List, Dict
-from .content import Content, ContentType, SlideBuilder
+from functools import lru_cache, wraps
+from html import escape as _escape
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+from .content import Content, ContentType, SlideBuilder, unpack_payload
 from .layouts import LayoutType
 
+
+def _render_markdown(value: str) -> str:
+    # Markdown is returned as-is since it will be processed by Reveal.js
+    return value
+
+
+# Text, code, image and equation output depends only on the payload, so
+# repeated payloads (logos, shared snippets, ...) are rendered once.
+_RENDER_CACHE_SIZE = 4096
+
+
+def _cacheable(value: Any) -> bool:
+    """
+    Whether value may share a cache entry with every value equal to it.
+
+    Only exact str, None and tuples of those qualify: True == 1 == 1.0 and
+    equal values of other types can print differently.
+    """
+    kind = type(value)
+    if kind is str or value is None:
+        return True
+    return kind is tuple and all(map(_cacheable, value))
+
+
+def _memoized(render: Callable[..., str]) -> Callable[..., str]:
+    """Cache render by its arguments when they are all _cacheable, else render uncached."""
+    cached = lru_cache(maxsize=_RENDER_CACHE_SIZE)(render)
+
+    @wraps(render)
+    def wrapper(*args: Any) -> str:
+        if all(map(_cacheable, args)):
+            return cached(*args)
+        return render(*args)
+
+    return wrapper
+
+
+@_memoized
+def _render_text(value: str) -> str:
+    return "".join(("<p>", _escape(f"{value}", quote=False), "</p>"))
+
+
+def _render_list(tag: str, items: List[str]) -> str:
+    parts = [f"<{tag}>\n"]
+    append = parts.append
+    for item in items:
+        append("<li>")
+        append(_escape(f"{item}", quote=False))
+        append("</li>\n")
+    append(f"</{tag}>")
+    return "".join(parts)
+
+
+def _render_bullet_list(value: List[str]) -> str:
+    return _render_list("ul", value)
+
+
+def _render_numbered_list(value: List[str]) -> str:
+    return _render_list("ol", value)
+
+
+def _render_equation(value: Any) -> str:
+    equation, description = unpack_payload(ContentType.EQUATION, value)
+    return _equation_html(equation, tuple((description or {}).items()))
+
+
+@_memoized
+def _equation_html(equation: str, description: Tuple[Tuple[str, str], ...]) -> str:
+    parts = ["<p>$$\n", f"{equation}", "\n$$</p>\n"]
+    if description:
+        append = parts.append
+        append("<p>Onde:</p><ul>")
+        for symbol, desc in description:
+            append("<li><strong>")
+            append(f"{symbol}")
+            append("</strong>: ")
+            append(f"{desc}")
+            append("</li>\n")
+        append("</ul>")
+    return "".join(parts)
+
+
+def _render_image(value: Any) -> str:
+    return _image_html(*unpack_payload(ContentType.IMAGE, value))
+
+
+@_memoized
+def _image_html(url: str, caption: Optional[str]) -> str:
+    parts = ['<img src="', f"{url}", '" alt="', _escape(f"{caption}"), '" style="max-width: 100%;">\n']
+    if caption:
+        parts.extend(("<p>", _escape(f"{caption}", quote=False), "</p>"))
+    return "".join(parts)
+
+
+def _render_code(value: Any) -> str:
+    return _code_html(*unpack_payload(ContentType.CODE, value))
+
+
+@_memoized
+def _code_html(code: str, language: str) -> str:
+    return "".join(('<pre><code class="language-', f"{language}", '">', f"{code}", '</code></pre>'))
+
+
+def _as_rows(data: Any) -> Any:
+    # Array-like tables (numpy, pandas .values, ...) convert to nested Python
+    # lists in one C-level call instead of boxing a scalar per cell in the loop.
+    # Only for dtypes whose cells print the same either way: bool, int, object,
+    # str, float64 and complex128. str(np.float32(0.1)) is 0.1 but its tolist()
+    # value prints as 0.10000000149011612.
+    dtype = getattr(data, "dtype", None)
+    if dtype is not None and (dtype.kind in "biuOU" or dtype.char in "dD"):
+        return data.tolist()
+    return data
+
+
+def _render_table(value: Any) -> str:
+    headers, rows = unpack_payload(ContentType.TABLE, value)
+    parts = ["<table>\n<thead><tr>"]
+    append = parts.append
+    for header in _as_rows(headers):
+        append("<th>")
+        append(_escape(str(header), quote=False))
+        append("</th>")
+    append("</tr></thead>\n<tbody>")
+    for row in _as_rows(rows):
+        append("<tr>")
+        for cell in row:
+            append("<td>")
+            append(_escape(str(cell), quote=False))
+            append("</td>")
+        append("</tr>")
+    append("</tbody>\n</table>")
+    return "".join(parts)
+
+
+def _render_diagram(value: str) -> str:
+    return "".join(('<div class="mermaid">', f"{value}", '</div>'))
+
+
+_YT_IFRAME = (
+    '<iframe width="720" height="480" src="%s" frameborder="0" '
+    'allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" '
+    'allowfullscreen></iframe>'
+)
+_MEDIA_TEMPLATE = '<%s src="%s" controls style="max-width: 100%%;"></%s>'
+
+
+def _render_media(value: Any) -> str:
+    url, media_type = unpack_payload(ContentType.MEDIA, value)
+    if "youtube.com" in url:  # Identifica se o link é do YouTube
+        return _YT_IFRAME % url
+    return _MEDIA_TEMPLATE % (media_type, url, media_type)
+
+
+# One lookup per content instead of walking an if/elif chain on every render
+_RENDERERS: Dict[ContentType, Callable[[Any], str]] = {
+    ContentType.TEXT: _render_text,
+    ContentType.BULLET_LIST: _render_bullet_list,
+    ContentType.NUMBERED_LIST: _render_numbered_list,
+    ContentType.EQUATION: _render_equation,
+    ContentType.IMAGE: _render_image,
+    ContentType.CODE: _render_code,
+    ContentType.TABLE: _render_table,
+    ContentType.DIAGRAM: _render_diagram,
+    ContentType.MEDIA: _render_media,
+    ContentType.MARKDOWN: _render_markdown,
+}
+_get_renderer = _RENDERERS.get
+
+
+def _render_content(content: Content) -> str:
+    """Render one content item, bypassing the HTMLGenerator attribute lookups."""
+    renderer = _get_renderer(content.type)
+    if renderer is None:
+        return ""
+    return renderer(content.value)
+
+
+def _render_contents(contents: Sequence[Content]) -> str:
+    if not contents:
+        return ""
+    render = _render_content
+    if len(contents) == 1:
+        return render(contents[0])
+    return "\n".join([render(content) for content in contents])
+
+
+# Not indented: the textarea body is the markdown source itself
+_MARKDOWN_TEMPLATE = """
+<section data-markdown data-auto-animate>
+<textarea data-template>
+{content}
+</textarea>
+</section>
+"""
+
+_BLANK_TEMPLATE = """
+            <section{background}{extra}>
+                {content}
+            </section>
+            """
+
+_SECTION_TEMPLATE = """
+            <section{background}{extra} data-auto-animate>
+                <h1>{title}</h1>
+            </section>
+            """
+
+_COMPARISON_HEADERS_TEMPLATE = """
+                <div class="comparison-headers">
+                    <div class="left-header"><h3>{left}</h3></div>
+                    <div class="right-header"><h3>{right}</h3></div>
+                </div>
+                """
+
+_TWO_COLUMNS_TEMPLATE = """
+            <section{background}{extra}>
+                <{title_tag}>{title}</{title_tag}>
+                {headers}
+                <div class="two-columns">
+                    <div class="column">{left}</div>
+                    <div class="column">{right}</div>
+                </div>
+            </section>
+            """
+
+_QUOTE_TEMPLATE = """
+            <section{background}{extra}>
+                <blockquote>
+                    {content}
+                    <cite>{attribution}</cite>
+                </blockquote>
+            </section>
+            """
+
+_TITLE_CONTENT_TEMPLATE = """
+            <section{background}{extra} data-auto-animate>
+                <{title_tag}>{title}</{title_tag}>
+                <div class="content {align}">
+                    {content}
+                </div>
+            </section>
+            """
+
+
+def _section_attrs(slide: SlideBuilder) -> Tuple[str, str]:
+    """Return the background attribute and extra classes of a slide's <section>."""
+    config = slide.layout_config
+    background = f' data-background="{config.background}"' if config.background else ''
+    extra = ' ' + ' '.join(config.extra_classes) if config.extra_classes else ''
+    return background, extra
+
+
+def _render_blank_slide(slide: SlideBuilder) -> str:
+    background, extra = _section_attrs(slide)
+    return _BLANK_TEMPLATE.format(
+        background=background, extra=extra, content=_render_contents(slide.contents)
+    )
+
+
+def _render_section_slide(slide: SlideBuilder) -> str:
+    background, extra = _section_attrs(slide)
+    return _SECTION_TEMPLATE.format(background=background, extra=extra, title=slide.title)
+
+
+def _render_columns_slide(slide: SlideBuilder) -> str:
+    background, extra = _section_attrs(slide)
+    headers = ""
+    left_header, right_header = slide.comparison_headers
+    if slide.layout == LayoutType.COMPARISON and (left_header or right_header):
+        headers = _COMPARISON_HEADERS_TEMPLATE.format(left=left_header, right=right_header)
+    return _TWO_COLUMNS_TEMPLATE.format(
+        background=background,
+        extra=extra,
+        title_tag=slide.layout_config.title_size,
+        title=slide.title,
+        headers=headers,
+        left=_render_contents(slide.columns[0]),
+        right=_render_contents(slide.columns[1])
+    )
+
+
+def _render_quote_slide(slide: SlideBuilder) -> str:
+    background, extra = _section_attrs(slide)
+    contents = slide.contents
+    return _QUOTE_TEMPLATE.format(
+        background=background,
+        extra=extra,
+        content=_escape(f"{contents[0].value}", quote=False) if contents else "",
+        attribution=_escape(f"{contents[1].value}", quote=False) if len(contents) > 1 else ""
+    )
+
+
+def _render_title_content_slide(slide: SlideBuilder) -> str:
+    background, extra = _section_attrs(slide)
+    config = slide.layout_config
+    return _TITLE_CONTENT_TEMPLATE.format(
+        background=background,
+        extra=extra,
+        title_tag=config.title_size,
+        title=slide.title,
+        align=config.content_align,
+        content=_render_contents(slide.contents)
+    )
+
+
+# Layouts without an entry use the default TITLE_CONTENT rendering
+_SLIDE_RENDERERS: Dict[LayoutType, Callable[[SlideBuilder], str]] = {
+    LayoutType.BLANK: _render_blank_slide,
+    LayoutType.SECTION: _render_section_slide,
+    LayoutType.TWO_COLUMNS: _render_columns_slide,
+    LayoutType.COMPARISON: _render_columns_slide,
+    LayoutType.QUOTE: _render_quote_slide,
+}
+_get_slide_renderer = _SLIDE_RENDERERS.get
+
+
 class HTMLGenerator:
     """
     Utility class for converting slide content to HTML.
@@ -29,70 +348,7 @@ class HTMLGenerator:
             >>> print(html)
             '<p>Hello World</p>'
         """
-        if content.type == ContentType.MARKDOWN:
-            # For Markdown content, we return it as-is since it will be processed by Reveal.js
-            return content.value
-
-        if content.type == ContentType.TEXT:
-            return f"<p>{content.value}</p>"
-
-        elif content.type == ContentType.BULLET_LIST:
-            items = "\n".join(f"<li>{item}</li>" for item in content.value)
-            return f"<ul>\n{items}\n</ul>"
-
-        elif content.type == ContentType.NUMBERED_LIST:
-            items = "\n".join(f"<li>{item}</li>" for item in content.value)
-            return f"<ol>\n{items}\n</ol>"
-
-        elif content.type == ContentType.EQUATION:
-            equation = content.value['equation']
-            description = content.value.get('description', {})
-            desc_html = ""
-            if description:
-                items = "\n".join(f"<li><strong>{symbol}</strong>: {desc}</li>"
-                                  for symbol, desc in description.items())
-                desc_html = f"<p>Onde:</p><ul>{items}</ul>"
-            return f"<p>$$\n{equation}\n$$</p>\n{desc_html}"
-
-        elif content.type == ContentType.IMAGE:
-            url = content.value['url']
-            caption = content.value.get('caption', '')
-            caption_html = f"<p>{caption}</p>" if caption else ""
-            return f'<img src="{url}" alt="{caption}" style="max-width: 100%;">\n{caption_html}'
-
-        elif content.type == ContentType.CODE:
-            code = content.value['code']
-            language = content.value.get('language', 'python')
-            return f'<pre><code class="language-{language}">{code}</code></pre>'
-
-        elif content.type == ContentType.TABLE:
-            headers = content.value['headers']
-            rows = content.value['rows']
-            header_html = "".join(f"<th>{h}</th>" for h in headers)
-            rows_html = "".join(
-                "<tr>" + "".join(f"<td>{cell}</td>" for cell in row) + "</tr>"
-                for row in rows
-            )
-            return f"""<table>
-                <thead><tr>{header_html}</tr></thead>
-                <tbody>{rows_html}</tbody>
-            </table>"""
-
-        elif content.type == ContentType.DIAGRAM:
-            return f'<div class="mermaid">{content.value}</div>'
-
-        elif content.type == ContentType.MEDIA:
-            url = content.value['url']
-            media_type = content.value['type']
-
-            if "youtube.com" in url:  # Identifica se o link é do YouTube
-                return f'<iframe width="720" height="480" src="{url}" frameborder="0" ' \
-                       f'allow="accelerometer; autoplay; clipboard-write; encrypted-media; gyroscope; picture-in-picture" ' \
-                       f'allowfullscreen></iframe>'
-
-            return f'<{media_type} src="{url}" controls style="max-width: 100%;"></{media_type}>'
-
-        return ""
+        return _render_content(content)
 
     @staticmethod
     def generate_slide_html(slide: SlideBuilder) -> str:
@@ -110,83 +366,12 @@ class HTMLGenerator:
             >>> html = HTMLGenerator.generate_slide_html(slide)
         """
         if slide.is_markdown:
-            # Handle Markdown slides differently
-            markdown_content = "\n".join(
-                content.value if content.type == ContentType.MARKDOWN
-                else HTMLGenerator.content_to_html(content)
-                for content in slide.contents
-            )
-            return f"""
-            <section data-markdown data-auto-animate>
-                <textarea data-template>
-                    {markdown_content}
-                </textarea>
-            </section>
-            """
-        background = f' data-background="{slide.layout_config.background}"' if slide.layout_config.background else ''
-        extra_classes = ' ' + ' '.join(slide.layout_config.extra_classes) if slide.layout_config.extra_classes else ''
-
-        if slide.layout == LayoutType.BLANK:
-            return f"""
-            <section{background}{extra_classes}>
-                {HTMLGenerator._generate_content_html(slide.contents)}
-            </section>
-            """
-
-        elif slide.layout == LayoutType.SECTION:
-            return f"""
-            <section{background}{extra_classes} data-auto-animate>
-                <h1>{slide.title}</h1>
-            </section>
-            """
-
-        elif slide.layout in [LayoutType.TWO_COLUMNS, LayoutType.COMPARISON]:
-            left_column = HTMLGenerator._generate_content_html(slide.columns[0])
-            right_column = HTMLGenerator._generate_content_html(slide.columns[1])
-
-            comparison_headers = ""
-            if slide.layout == LayoutType.COMPARISON and hasattr(slide, 'comparison_headers'):
-                comparison_headers = f"""
-                <div class="comparison-headers">
-                    <div class="left-header"><h3>{slide.comparison_headers[0]}</h3></div>
-                    <div class="right-header"><h3>{slide.comparison_headers[1]}</h3></div>
-                </div>
-                """
+            # Markdown renders as-is, so a single-markdown slide needs no join
+            return _MARKDOWN_TEMPLATE.format(content=_render_contents(slide.contents))
 
-            return f"""
-            <section{background}{extra_classes}>
-                <{slide.layout_config.title_size}>{slide.title}</{slide.layout_config.title_size}>
-                {comparison_headers}
-                <div class="two-columns">
-                    <div class="column">{left_column}</div>
-                    <div class="column">{right_column}</div>
-                </div>
-            </section>
-            """
-
-        elif slide.layout == LayoutType.QUOTE:
-            content = slide.contents[0].value if slide.contents else ""
-            attribution = slide.contents[1].value if len(slide.contents) > 1 else ""
-            return f"""
-            <section{background}{extra_classes}>
-                <blockquote>
-                    {content}
-                    <cite>{attribution}</cite>
-                </blockquote>
-            </section>
-            """
-
-        else:  # Default TITLE_CONTENT layout
-            return f"""
-            <section{background}{extra_classes} data-auto-animate>
-                <{slide.layout_config.title_size}>{slide.title}</{slide.layout_config.title_size}>
-                <div class="content {slide.layout_config.content_align}">
-                    {HTMLGenerator._generate_content_html(slide.contents)}
-                </div>
-            </section>
-            """
+        return _get_slide_renderer(slide.layout, _render_title_content_slide)(slide)
 
     @staticmethod
     def _generate_content_html(contents: List[Content]) -> str:
         """Generate HTML for a list of content items."""
-        return "\n".join(HTMLGenerator.content_to_html(content) for content in contents)
\ No newline at end of file
+        return _render_contents(contents)
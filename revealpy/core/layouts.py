@@ -1,22 +1,22 @@
-from enum import Enum
+from enum import IntEnum, auto
 from typing import List, Optional, Dict, Any
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
-class LayoutType(Enum):
-    TITLE = "title"  # Only title
-    TITLE_CONTENT = "title_content"  # Title and content
-    TWO_COLUMNS = "two_columns"  # Title and two columns
-    TITLE_TWO_CONTENT = "title_two_content"  # Title and content in two rows
-    COMPARISON = "comparison"  # Title and two columns with headers
-    SECTION = "section"  # Big title for section breaks
-    BLANK = "blank"  # Blank slide for custom content
-    IMAGE_WITH_CAPTION = "image_with_caption"  # Centered image with caption
-    QUOTE = "quote"  # Quote with optional attribution
+class LayoutType(IntEnum):
+    TITLE = auto()  # Only title
+    TITLE_CONTENT = auto()  # Title and content
+    TWO_COLUMNS = auto()  # Title and two columns
+    TITLE_TWO_CONTENT = auto()  # Title and content in two rows
+    COMPARISON = auto()  # Title and two columns with headers
+    SECTION = auto()  # Big title for section breaks
+    BLANK = auto()  # Blank slide for custom content
+    IMAGE_WITH_CAPTION = auto()  # Centered image with caption
+    QUOTE = auto()  # Quote with optional attribution
 
-@dataclass
+@dataclass(slots=True)
 class LayoutConfig:
     type: LayoutType
     title_size: str = "h2"  # Can be h1, h2, h3 for different title sizes
     content_align: str = "left"  # left, center, right
     background: Optional[str] = None
-    extra_classes: List[str] = None
\ No newline at end of file
+    extra_classes: List[str] = field(default_factory=list)
\ No newline at end of file
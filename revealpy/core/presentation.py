@@ -1,10 +1,23 @@
-from typing import List
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, List, Optional, Tuple
 from revealpy.utils.export_pptx import PPTXExporter
-from revealpy.utils.helpers import load_template
+from revealpy.utils.helpers import load_template_parts
 from .content import SlideBuilder
 from .exporter import Exporter
 from .html_generator import HTMLGenerator
 
+# Below this many slides a thread pool costs more than it saves
+_PARALLEL_MIN_SLIDES = 32
+
+
+def _gil_enabled() -> bool:
+    """Whether the interpreter runs with the GIL (always true before 3.13)."""
+    is_gil_enabled = getattr(sys, "_is_gil_enabled", None)
+    return is_gil_enabled is None or is_gil_enabled()
+
+
 class Presentation:
     """
     Main class for creating and managing presentations.
@@ -28,6 +41,8 @@ class Presentation:
         >>> # Create a presentation with custom theme and transition
         >>> pres = Presentation(theme="night", transition="slide")
     """
+    __slots__ = ("theme", "transition", "enable_pdf_export", "slides", "_template_cache")
+
     def __init__(self, theme: str = "black", transition: str = "fade", enable_pdf_export: bool = False):
         """
         Initialize a new presentation.
@@ -41,6 +56,8 @@ class Presentation:
         self.transition = transition
         self.enable_pdf_export = enable_pdf_export
         self.slides: List[SlideBuilder] = []
+        # (settings, (head, tail)) of the last filled page template
+        self._template_cache: Optional[Tuple[tuple, Tuple[str, str]]] = None
 
     def create_slide(self, title: str) -> SlideBuilder:
         """
@@ -93,8 +110,7 @@ class Presentation:
             >>> pres = Presentation()
             >>> pres.export("my_presentation.html")
         """
-        html_content = self._generate_html(auto)
-        Exporter.export(filename, html_content)
+        Exporter.export_stream(filename, self._iter_html(auto))
 
     def export_pptx(self, filename: str = "presentation.pptx"):
         """
@@ -118,16 +134,65 @@ class Presentation:
         Args:
             auto (bool): Auto slides.
         """
-        slides_html = []
+        if len(self.slides) > 1:
+            # A single join over the same chunks export() streams, so the slides are
+            # not first joined on their own and then copied again into the template
+            return "".join(self._iter_html(auto))
+
+        # Empty and single-slide decks need no chunk generator or separators
+        head, tail = self._template_parts(auto)
+        if not self.slides:
+            return head + tail
+        return "".join((head, HTMLGenerator.generate_slide_html(self.slides[0]), tail))
+
+    def _template_parts(self, auto: bool) -> Tuple[str, str]:
+        """
+        Return the filled page template around the slides, reusing the last result.
 
-        for slide in self.slides:
-            contents_html = HTMLGenerator.generate_slide_html(slide)
-            slides_html.append(contents_html)
+        The cache is keyed on the settings rather than filled once in __init__,
+        so changing theme, transition or enable_pdf_export later still applies.
 
-        return load_template(
-            self.theme,
-            self.transition,
-            "\n".join(slides_html),
-            self.enable_pdf_export,
-            auto
-        )
+        Args:
+            auto (bool): Auto slides.
+        """
+        key = (self.theme, self.transition, self.enable_pdf_export, auto)
+        cached = self._template_cache
+        if cached is None or cached[0] != key:
+            cached = self._template_cache = (key, load_template_parts(*key))
+        return cached[1]
+
+    def _iter_html(self, auto: bool = False) -> Iterator[str]:
+        """
+        Yield the complete HTML for the presentation one slide at a time.
+
+        Args:
+            auto (bool): Auto slides.
+        """
+        head, tail = self._template_parts(auto)
+        yield head
+
+        for index, slide_html in enumerate(self._iter_slides_html()):
+            if index:
+                yield "\n"
+            yield slide_html
+
+        yield tail
+
+    def _iter_slides_html(self) -> Iterator[str]:
+        """
+        Yield the HTML of each slide, in order.
+
+        Used by both render() and export(). Slides are independent, so on
+        free-threaded Python builds large decks are rendered by a thread pool.
+        With the GIL enabled threads cannot speed up pure-Python rendering, and
+        slides are rendered one after the other.
+        """
+        slides = self.slides
+        generate_slide_html = HTMLGenerator.generate_slide_html
+        if len(slides) < _PARALLEL_MIN_SLIDES or _gil_enabled():
+            yield from map(generate_slide_html, slides)
+            return
+
+        workers = min(len(slides), os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            yield from executor.map(generate_slide_html, slides)
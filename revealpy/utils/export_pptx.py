@@ -1,97 +1,206 @@
 # utils/export_pptx.py
-from pptx import Presentation as PPTXPresentation
-from pptx.util import Inches
-import requests
+import logging
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Callable, Dict, Union
 from io import BytesIO
-from PIL import Image
-from cairosvg import svg2png
 
 from revealpy.core.content import ContentType
 
+logger = logging.getLogger(__name__)
+
+# Image downloads are latency-bound, so they are fetched concurrently up front
+_IMAGE_FETCH_WORKERS = 16
+_HTTP_POOL_CONNECTIONS = 16  # Distinct hosts kept in the connection pool
+_HTTP_POOL_MAXSIZE = 64  # Connections kept per host
+_IMAGE_FETCH_TIMEOUT = 30  # seconds
+_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# Shape geometry in EMU (914400 per inch); python-pptx accepts plain ints
+_EMU_PER_INCH = 914400
+_CONTENT_TOP = 2 * _EMU_PER_INCH  # Start below title
+_LEFT = _EMU_PER_INCH
+_WIDTH = 8 * _EMU_PER_INCH
+_TEXT_HEIGHT = _EMU_PER_INCH
+_TEXT_SPACING = 1_097_280  # 1.2"
+_LINE_HEIGHT = 274_320  # 0.3" per bullet point
+_TABLE_ROW_HEIGHT = 365_760  # 0.4" per table row
+_BLOCK_GAP = 457_200  # 0.5" below lists and tables
+_IMAGE_HEIGHT = 4 * _EMU_PER_INCH
+_IMAGE_SPACING = 4_114_800  # 4.5"
+_CAPTION_HEIGHT = 457_200  # 0.5"
+_CAPTION_SPACING = 640_080  # 0.7"
+_DEFAULT_SPACING = _EMU_PER_INCH
+
+
+def _download_image(get: Callable, url: str) -> BytesIO:
+    """Stream an image into memory without holding a second full copy as bytes."""
+    with get(url, stream=True, timeout=_IMAGE_FETCH_TIMEOUT) as response:
+        response.raise_for_status()
+        response.raw.decode_content = True  # Undo gzip/deflate transfer encoding
+        buffer = BytesIO()
+        shutil.copyfileobj(response.raw, buffer, _DOWNLOAD_CHUNK_SIZE)
+    return buffer
+
+
+def _fetch_image(get: Callable, url: str) -> Union[BytesIO, Exception]:
+    """Download an image, returning the exception instead of raising it."""
+    try:
+        return _download_image(get, url)
+    except Exception as e:
+        return e
+
 
 class PPTXExporter:
     def __init__(self, presentation):
         self.presentation = presentation  # Store the presentation object
+        # Downloaded image data by URL, or the exception of a failed download
+        self._image_cache: Dict[str, Union[BytesIO, Exception]] = {}
+        self._session = self._create_session()
+
+    @staticmethod
+    def _create_session():
+        """Create the HTTP session shared by every image download of this exporter."""
+        import requests
+
+        session = requests.Session()
+        adapter = requests.adapters.HTTPAdapter(
+            pool_connections=_HTTP_POOL_CONNECTIONS, pool_maxsize=_HTTP_POOL_MAXSIZE
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def convert_to_pptx(self, output_file="presentation.pptx"):
-        pptx = PPTXPresentation()
-
-        for slide in self.presentation.slides:
-            ppt_slide = pptx.slides.add_slide(pptx.slide_layouts[1])  # Using layout with title and content
+        # Imported here so that importing revealpy does not load python-pptx
+        from pptx import Presentation as PPTXPresentation
 
-            # Add title
-            if ppt_slide.shapes.title:
-                ppt_slide.shapes.title.text = slide.title
-
-            # Process each content element
-            current_top = Inches(2)  # Start below title
-            for content in slide.contents:
-                current_top = self._add_content_to_slide(ppt_slide, content, current_top)
+        pptx = PPTXPresentation()
+        # Failures are only remembered for one export; retry them on the next
+        self._image_cache = {
+            url: data for url, data in self._image_cache.items() if not isinstance(data, Exception)
+        }
+        try:
+            self._prefetch_images()
+
+            for slide in self.presentation.slides:
+                ppt_slide = pptx.slides.add_slide(pptx.slide_layouts[1])  # Using layout with title and content
+
+                # Add title
+                if ppt_slide.shapes.title:
+                    ppt_slide.shapes.title.text = slide.title
+
+                # Process each content element
+                current_top = _CONTENT_TOP
+                for content in slide.contents:
+                    current_top = self._add_content_to_slide(ppt_slide, content, current_top)
+        finally:
+            # Release pooled connections; the session reopens them if used again
+            self._session.close()
 
         pptx.save(output_file)
-        print(f"Arquivo PPTX salvo como {output_file}")
+        logger.info("PPTX saved to %s", output_file)
+
+    def _prefetch_images(self):
+        """
+        Download every image in the presentation concurrently into the image cache.
+
+        Each distinct URL is fetched once, however many slides use it. Failed
+        downloads are cached as their exception, so a broken URL is not
+        requested again when each slide using it is built.
+        """
+        urls = list({
+            content.payload()[0]
+            for slide in self.presentation.slides
+            for content in slide.contents
+            if content.type == ContentType.IMAGE
+        } - self._image_cache.keys())
+        if not urls:
+            return
+
+        fetch = partial(_fetch_image, self._session.get)
+        with ThreadPoolExecutor(max_workers=min(_IMAGE_FETCH_WORKERS, len(urls))) as executor:
+            self._image_cache.update(zip(urls, executor.map(fetch, urls)))
+
+    def _get_image(self, url: str) -> Union[BytesIO, Exception]:
+        """Return the cached data for an image, downloading it on first use."""
+        image_data = self._image_cache.get(url)
+        if image_data is None:
+            image_data = self._image_cache[url] = _fetch_image(self._session.get, url)
+        return image_data
 
     def _add_content_to_slide(self, ppt_slide, content, top):
         """Add content to PowerPoint slide and return the new top position."""
-        if content.type == ContentType.TEXT:
-            text_box = ppt_slide.shapes.add_textbox(
-                Inches(1), top, Inches(8), Inches(1)
-            )
-            text_frame = text_box.text_frame
-            text_frame.text = content.value
-            return top + Inches(1.2)
-
-        elif content.type == ContentType.BULLET_LIST:
-            text_box = ppt_slide.shapes.add_textbox(
-                Inches(1), top, Inches(8), Inches(0.3 * len(content.value))
-            )
-            text_frame = text_box.text_frame
-
-            for point in content.value:
-                p = text_frame.add_paragraph()
-                p.text = point
-                p.level = 0  # First level bullet
-
-            return top + Inches(0.3 * len(content.value) + 0.5)
-
-        elif content.type == ContentType.IMAGE:
-            try:
-                response = requests.get(content.value['url'])
-                image_data = BytesIO(response.content)
-                ppt_slide.shapes.add_picture(
-                    image_data, Inches(1), top, width=Inches(8)
-                )
-                # Add caption if exists
-                if content.value.get('caption'):
-                    caption_top = top + Inches(4)  # Adjust based on image height
-                    text_box = ppt_slide.shapes.add_textbox(
-                        Inches(1), caption_top, Inches(8), Inches(0.5)
-                    )
-                    text_box.text_frame.text = content.value['caption']
-                    return caption_top + Inches(0.7)
-                return top + Inches(4.5)
-            except Exception as e:
-                print(f"Error adding image: {e}")
-                return top
-
-        elif content.type == ContentType.TABLE:
-            rows = len(content.value['rows']) + 1  # +1 for header
-            cols = len(content.value['headers'])
-            shape = ppt_slide.shapes.add_table(
-                rows, cols, Inches(1), top, Inches(8), Inches(0.4 * rows)
-            )
-            table = shape.table
-
-            # Add headers
-            for i, header in enumerate(content.value['headers']):
-                table.cell(0, i).text = header
-
-            # Add rows
-            for i, row in enumerate(content.value['rows'], 1):
-                for j, cell in enumerate(row):
-                    table.cell(i, j).text = str(cell)
-
-            return top + Inches(0.4 * rows + 0.5)
-
+        return self._HANDLERS.get(content.type, PPTXExporter._handle_default)(self, ppt_slide, content, top)
+
+    def _handle_text(self, ppt_slide, content, top):
+        text_box = ppt_slide.shapes.add_textbox(_LEFT, top, _WIDTH, _TEXT_HEIGHT)
+        text_frame = text_box.text_frame
+        text_frame.text = content.value
+        return top + _TEXT_SPACING
+
+    def _handle_bullet_list(self, ppt_slide, content, top):
+        height = _LINE_HEIGHT * len(content.value)
+        text_box = ppt_slide.shapes.add_textbox(_LEFT, top, _WIDTH, height)
+        text_frame = text_box.text_frame
+
+        for point in content.value:
+            p = text_frame.add_paragraph()
+            p.text = point
+            p.level = 0  # First level bullet
+
+        return top + height + _BLOCK_GAP
+
+    def _handle_image(self, ppt_slide, content, top):
+        url, caption = content.payload()
+        image_data = self._get_image(url)
+        if isinstance(image_data, Exception):
+            logger.warning("Error adding image %s: %s", url, image_data)
+            return top
+        try:
+            image_data.seek(0)  # The same buffer is reused for every slide showing this image
+            ppt_slide.shapes.add_picture(image_data, _LEFT, top, width=_WIDTH)
+            # Add caption if exists
+            if caption:
+                caption_top = top + _IMAGE_HEIGHT  # Adjust based on image height
+                text_box = ppt_slide.shapes.add_textbox(_LEFT, caption_top, _WIDTH, _CAPTION_HEIGHT)
+                text_box.text_frame.text = caption
+                return caption_top + _CAPTION_SPACING
+            return top + _IMAGE_SPACING
+        except Exception as e:
+            logger.warning("Error adding image %s: %s", url, e)
+            return top
+
+    def _handle_table(self, ppt_slide, content, top):
+        headers, data_rows = content.payload()
+        rows = len(data_rows) + 1  # +1 for header
+        cols = len(headers)
+        height = _TABLE_ROW_HEIGHT * rows
+        shape = ppt_slide.shapes.add_table(rows, cols, _LEFT, top, _WIDTH, height)
+        # Walk the row and cell elements once instead of looking up
+        # every cell in the table XML with table.cell(i, j)
+        table_rows = iter(shape.table.rows)
+
+        # Add headers
+        for table_cell, header in zip(next(table_rows).cells, headers):
+            table_cell.text = header
+
+        # Add rows
+        for table_row, row in zip(table_rows, data_rows):
+            for table_cell, cell in zip(table_row.cells, row):
+                table_cell.text = str(cell)
+
+        return top + height + _BLOCK_GAP
+
+    def _handle_default(self, ppt_slide, content, top):
         # Default spacing if content type not handled
-        return top + Inches(1)
\ No newline at end of file
+        return top + _DEFAULT_SPACING
+
+    # Content type -> handler, built once with the class
+    _HANDLERS = {
+        ContentType.TEXT: _handle_text,
+        ContentType.BULLET_LIST: _handle_bullet_list,
+        ContentType.IMAGE: _handle_image,
+        ContentType.TABLE: _handle_table,
+    }
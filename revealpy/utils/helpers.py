@@ -1,72 +1,27 @@
-def load_template(theme: str, transition: str, slides_content: str, pdf_export: bool = False, auto: bool = False) -> str:
-    """
-    Load and fill the HTML template for the presentation.
+import re
+from typing import Tuple
 
-    Args:
-        theme (str): Theme name
-        transition (str): Transition effect
-        slides_content (str): HTML content of all slides
-        pdf_export (bool): Whether to include PDF export functionality
-        auto (bool): Auto slides.
-    """
-    auto_slides = """
-        autoSlide: 15000,
-        loop: true,
-    """ if auto else ""
-    pdf_plugin = """
-        // PDF Export Plugin
-    let pdfExportPlugin = { src: 'https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/plugin/pdf-export/pdfexport.js', async: true };
-    """ if pdf_export else ""
-
-    pdf_button = """
-        <button onclick="exportPDF()" class="pdf-btn">Export to PDF</button>
-    """ if pdf_export else ""
-
-    pdf_script = """
-        function exportPDF() {
-    
-        if (typeof Reveal.getPdf === 'function') {
-            // Gera o PDF diretamente
-            Reveal.getPdf().then(pdf => {
-                // Cria um link de download para o PDF
-                const link = document.createElement('a');
-                link.href = URL.createObjectURL(pdf);
-                link.download = 'apresentacao.pdf';
-                link.click();
-            }).catch(err => {
-                console.error('Erro ao exportar PDF:', err);
-                alert('Houve um erro ao gerar o PDF.');
-            });}else{
-                // Instructions alert
-                alert('PDF Plugin não está carregado ou disponível.\\n' +
-                      'Para exportar como PDF:\\n\\n' +
-                      '1. Pressione Ctrl+P (Cmd+P no Mac)\\n' +
-                      '2. Mude o destino para "Salvar como PDF"\\n' +
-                      '3. Em Mais configurações:\\n' +
-                      '   - Ative a opção "Gráficos em segundo plano"\\n' +
-                      '   - Defina a orientação como "Paisagem"\\n' +
-                      '   - Defina as margens como "Nenhuma"\\n' +
-                      '4. Clique em Salvar');
-    
-                // Trigger print dialog
-                window.print();
-            }
-            }
-    """ if pdf_export else ""
+# Every Reveal.js asset comes from this one versioned prefix
+_REVEAL_CDN = "https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0"
+_MERMAID_URL = "https://cdn.jsdelivr.net/npm/mermaid@11.4.1/dist/mermaid.min.js"
 
-    return f"""
+# The page template is split around the slides so they can be streamed between
+# the two parts. Both halves are plain str.format templates built once at import.
+_TEMPLATE_HEAD = """
     <!DOCTYPE html>
     <html>
     <head>
         <meta charset="utf-8">
         <meta name="viewport" content="width=device-width, initial-scale=1.0">
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/reveal.min.css">
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/theme/{theme}.min.css">
+        <link rel="preconnect" href="https://cdnjs.cloudflare.com">
+        <link rel="preconnect" href="https://cdn.jsdelivr.net">
+        <link rel="stylesheet" href="{cdn}/reveal.min.css">
+        <link rel="stylesheet" href="{cdn}/theme/{theme}.min.css">
 
-        <script src="https://cdn.jsdelivr.net/npm/mermaid@11.4.1/dist/mermaid.min.js"></script>
+        <script src="{mermaid}"></script>
 
         <!-- Code syntax highlighting -->
-        <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/plugin/highlight/monokai.min.css">
+        <link rel="stylesheet" href="{cdn}/plugin/highlight/monokai.min.css">
 
         <style>
             .comparison-headers {{
@@ -120,17 +75,19 @@ def load_template(theme: str, transition: str, slides_content: str, pdf_export:
     <body>
         <div class="reveal">
             <div class="slides">
-                {slides_content}
+                """
+
+_TEMPLATE_TAIL = """
             </div>
         </div>
 
         {pdf_button}
 
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/reveal.js"></script>
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/plugin/markdown/markdown.min.js"></script>
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/plugin/highlight/highlight.min.js"></script>
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/plugin/math/math.min.js"></script>
-        <script src="https://cdnjs.cloudflare.com/ajax/libs/reveal.js/4.5.0/plugin/zoom/zoom.min.js"></script>
+        <script src="{cdn}/reveal.js"></script>
+        <script src="{cdn}/plugin/markdown/markdown.min.js"></script>
+        <script src="{cdn}/plugin/highlight/highlight.min.js"></script>
+        <script src="{cdn}/plugin/math/math.min.js"></script>
+        <script src="{cdn}/plugin/zoom/zoom.min.js"></script>
 
         <script>
             {pdf_script}
@@ -154,4 +111,113 @@ def load_template(theme: str, transition: str, slides_content: str, pdf_export:
         </script>
     </body>
     </html>
-    """
\ No newline at end of file
+    """
+
+
+def _with_assets(template: str) -> str:
+    # Fill the asset URLs once at import; str.replace leaves the format fields alone
+    return template.replace("{cdn}", _REVEAL_CDN).replace("{mermaid}", _MERMAID_URL)
+
+
+_LEADING_WHITESPACE = re.compile(r"\n\s+")
+
+
+def _minify(template: str) -> str:
+    # Drop indentation and blank lines; line breaks stay so the inline JS keeps its statements
+    return _LEADING_WHITESPACE.sub("\n", template)
+
+
+_TEMPLATE_HEAD = _minify(_with_assets(_TEMPLATE_HEAD))
+_TEMPLATE_TAIL = _minify(_with_assets(_TEMPLATE_TAIL))
+
+_AUTO_SLIDES = {
+    True: _minify("""
+        autoSlide: 15000,
+        loop: true,
+    """),
+    False: "",
+}
+
+_PDF_FRAGMENTS = {
+    True: {
+        "pdf_plugin": _minify(_with_assets("""
+        // PDF Export Plugin
+    let pdfExportPlugin = { src: '{cdn}/plugin/pdf-export/pdfexport.js', async: true };
+    """)),
+        "pdf_button": _minify("""
+        <button onclick="exportPDF()" class="pdf-btn">Export to PDF</button>
+    """),
+        "pdf_script": _minify("""
+        function exportPDF() {
+    
+        if (typeof Reveal.getPdf === 'function') {
+            // Gera o PDF diretamente
+            Reveal.getPdf().then(pdf => {
+                // Cria um link de download para o PDF
+                const link = document.createElement('a');
+                link.href = URL.createObjectURL(pdf);
+                link.download = 'apresentacao.pdf';
+                link.click();
+            }).catch(err => {
+                console.error('Erro ao exportar PDF:', err);
+                alert('Houve um erro ao gerar o PDF.');
+            });}else{
+                // Instructions alert
+                alert('PDF Plugin não está carregado ou disponível.\\n' +
+                      'Para exportar como PDF:\\n\\n' +
+                      '1. Pressione Ctrl+P (Cmd+P no Mac)\\n' +
+                      '2. Mude o destino para "Salvar como PDF"\\n' +
+                      '3. Em Mais configurações:\\n' +
+                      '   - Ative a opção "Gráficos em segundo plano"\\n' +
+                      '   - Defina a orientação como "Paisagem"\\n' +
+                      '   - Defina as margens como "Nenhuma"\\n' +
+                      '4. Clique em Salvar');
+    
+                // Trigger print dialog
+                window.print();
+            }
+            }
+    """),
+    },
+    False: {"pdf_plugin": "", "pdf_button": "", "pdf_script": ""},
+}
+
+
+def load_template(theme: str, transition: str, slides_content: str, pdf_export: bool = False, auto: bool = False) -> str:
+    """
+    Load and fill the HTML template for the presentation.
+
+    Args:
+        theme (str): Theme name
+        transition (str): Transition effect
+        slides_content (str): HTML content of all slides
+        pdf_export (bool): Whether to include PDF export functionality
+        auto (bool): Auto slides.
+    """
+    head, tail = load_template_parts(theme, transition, pdf_export, auto)
+    return "".join((head, slides_content, tail))
+
+
+def load_template_parts(theme: str, transition: str, pdf_export: bool = False, auto: bool = False) -> Tuple[str, str]:
+    """
+    Fill the HTML template and return the markup before and after the slides.
+
+    Lets callers write the slides between the two parts without building the
+    whole document as a single string first.
+
+    Args:
+        theme (str): Theme name
+        transition (str): Transition effect
+        pdf_export (bool): Whether to include PDF export functionality
+        auto (bool): Auto slides.
+
+    Returns:
+        Tuple[str, str]: The template head and tail.
+    """
+    head = _TEMPLATE_HEAD.format(theme=theme)
+    tail = _TEMPLATE_TAIL.format(
+        transition=transition,
+        auto_slides=_AUTO_SLIDES[bool(auto)],
+        **_PDF_FRAGMENTS[bool(pdf_export)]
+    )
+    return head, tail
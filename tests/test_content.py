@@ -0,0 +1,108 @@
+import unittest
+
+from revealpy.core.content import Content, ContentType, SlideBuilder, unpack_payload
+from revealpy.core.html_generator import HTMLGenerator
+from revealpy.core.layouts import LayoutType
+
+
+class TestColumns(unittest.TestCase):
+    def test_columns_are_mutable_lists(self):
+        slide = SlideBuilder("Columns", LayoutType.TWO_COLUMNS)
+        slide.columns[0].append(Content(ContentType.TEXT, "Left"))
+        slide.add_to_column(1, Content(ContentType.TEXT, "Right"))
+        self.assertEqual([len(column) for column in slide.columns], [1, 1])
+
+        html = HTMLGenerator.generate_slide_html(slide)
+        self.assertIn('<div class="column"><p>Left</p></div>', html)
+        self.assertIn('<div class="column"><p>Right</p></div>', html)
+
+    def test_columns_can_be_assigned(self):
+        slide = SlideBuilder("Columns", LayoutType.TWO_COLUMNS)
+        slide.columns = [[Content(ContentType.TEXT, "A")], []]
+        slide.add_to_column(1, Content(ContentType.TEXT, "B"))
+        self.assertEqual([c.value for column in slide.columns for c in column], ["A", "B"])
+
+
+class TestAddMany(unittest.TestCase):
+    def test_adds_contents_in_order_from_a_generator(self):
+        slide = SlideBuilder("Many").add_text("first")
+        slide.add_many(Content(ContentType.TEXT, text) for text in ("second", "third"))
+        self.assertEqual([c.value for c in slide.contents], ["first", "second", "third"])
+        self.assertFalse(slide.is_markdown)
+
+    def test_detects_markdown_from_a_generator(self):
+        items = [Content(ContentType.TEXT, "intro"), Content(ContentType.MARKDOWN, "# Title")]
+        slide = SlideBuilder("Many").add_many(item for item in items)
+        self.assertTrue(slide.is_markdown)
+        self.assertEqual(len(slide.contents), 2)
+
+    def test_keeps_markdown_flag_from_earlier_content(self):
+        slide = SlideBuilder("Many").add_markdown("# Title")
+        slide.add_many(iter([Content(ContentType.TEXT, "more")]))
+        self.assertTrue(slide.is_markdown)
+
+    def test_returns_builder_for_chaining(self):
+        slide = SlideBuilder("Many")
+        self.assertIs(slide.add_many([]), slide)
+        self.assertEqual(slide.contents, [])
+
+
+class TestTextBatch(unittest.TestCase):
+    def test_creates_one_text_content_per_string(self):
+        contents = Content.text_batch(text for text in ("a", "b"))
+        self.assertEqual(contents, [Content(ContentType.TEXT, "a"), Content(ContentType.TEXT, "b")])
+
+    def test_renders_like_add_text(self):
+        batched = SlideBuilder("Batch").add_many(Content.text_batch(["a", "b"]))
+        added = SlideBuilder("Batch").add_text("a").add_text("b")
+        self.assertEqual(
+            HTMLGenerator.generate_slide_html(batched), HTMLGenerator.generate_slide_html(added)
+        )
+
+
+class TestPayload(unittest.TestCase):
+    def test_builder_payloads_are_tuples(self):
+        slide = SlideBuilder("Payloads").add_image("logo.png", "Logo").add_code("x = 1")
+        self.assertEqual(slide.contents[0].payload(), ("logo.png", "Logo"))
+        self.assertEqual(slide.contents[1].payload(), ("x = 1", "python"))
+
+    def test_dict_payloads_unpack_in_field_order(self):
+        cases = [
+            (ContentType.IMAGE, {"caption": "Logo", "url": "logo.png"}, ("logo.png", "Logo")),
+            (ContentType.CODE, {"code": "x = 1", "language": "js"}, ("x = 1", "js")),
+            (ContentType.TABLE, {"rows": [[1]], "headers": ["a"]}, (["a"], [[1]])),
+            (ContentType.MEDIA, {"url": "a.mp3", "type": "audio"}, ("a.mp3", "audio")),
+            (ContentType.EQUATION, {"equation": "x", "description": {"x": "var"}}, ("x", {"x": "var"})),
+        ]
+        for content_type, value, expected in cases:
+            with self.subTest(content_type=content_type.name):
+                self.assertEqual(Content(content_type, value).payload(), expected)
+                self.assertEqual(unpack_payload(content_type, value), expected)
+
+    def test_dict_payloads_fill_optional_fields(self):
+        self.assertEqual(Content(ContentType.IMAGE, {"url": "logo.png"}).payload(), ("logo.png", ""))
+        self.assertEqual(Content(ContentType.CODE, {"code": "x"}).payload(), ("x", "python"))
+        self.assertEqual(Content(ContentType.EQUATION, {"equation": "x"}).payload(), ("x", None))
+
+    def test_dict_payload_missing_required_field(self):
+        with self.assertRaises(KeyError):
+            Content(ContentType.TABLE, {"headers": ["a"]}).payload()
+
+    def test_dict_and_tuple_payloads_render_the_same(self):
+        pairs = [
+            (ContentType.IMAGE, {"url": "logo.png", "caption": "Logo"}, ("logo.png", "Logo")),
+            (ContentType.CODE, {"code": "x = 1"}, ("x = 1", "python")),
+            (ContentType.TABLE, {"headers": ["a"], "rows": [[1]]}, (["a"], [[1]])),
+            (ContentType.MEDIA, {"url": "a.mp4", "type": "video"}, ("a.mp4", "video")),
+            (ContentType.EQUATION, {"equation": "x", "description": {"x": "var"}}, ("x", {"x": "var"})),
+        ]
+        for content_type, as_dict, as_tuple in pairs:
+            with self.subTest(content_type=content_type.name):
+                self.assertEqual(
+                    HTMLGenerator.content_to_html(Content(content_type, as_dict)),
+                    HTMLGenerator.content_to_html(Content(content_type, as_tuple)),
+                )
+
+
+if __name__ == "__main__":
+    unittest.main()
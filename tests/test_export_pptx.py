@@ -0,0 +1,45 @@
+import io
+import threading
+import unittest
+
+from revealpy import Presentation
+from revealpy.utils.export_pptx import PPTXExporter
+
+
+class _Session:
+    """Stands in for requests.Session, failing every download."""
+
+    def __init__(self):
+        self.requested = []
+        self._lock = threading.Lock()
+
+    def get(self, url, **kwargs):
+        with self._lock:
+            self.requested.append(url)
+        raise OSError("404 Not Found")
+
+    def close(self):
+        pass
+
+
+class TestImageDownloads(unittest.TestCase):
+    def test_failed_image_is_requested_once_per_export(self):
+        pres = Presentation()
+        for title in ("One", "Two", "Three"):
+            pres.create_slide(title).add_image("https://example.invalid/logo.png")
+
+        exporter = PPTXExporter(pres)
+        exporter._session = session = _Session()
+        with self.assertLogs("revealpy.utils.export_pptx", "WARNING") as logs:
+            exporter.convert_to_pptx(io.BytesIO())
+        self.assertEqual(session.requested, ["https://example.invalid/logo.png"])
+        self.assertEqual(len(logs.records), 3)
+
+        # A later export tries the broken URL again
+        with self.assertLogs("revealpy.utils.export_pptx", "WARNING"):
+            exporter.convert_to_pptx(io.BytesIO())
+        self.assertEqual(len(session.requested), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
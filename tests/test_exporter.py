@@ -0,0 +1,69 @@
+import os
+import tempfile
+import unittest
+
+from revealpy import Presentation
+from revealpy.core.content import Content, ContentType
+from revealpy.core.exporter import Exporter
+
+
+class TestExportStream(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        self.path = os.path.join(self.tmp.name, "deck.html")
+
+    def test_writes_str_and_bytes_chunks(self):
+        Exporter.export_stream(self.path, ["<p>olá</p>", b"\n", "fim"])
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "<p>olá</p>\nfim")
+        self.assertEqual(os.listdir(self.tmp.name), ["deck.html"])
+
+    def test_creates_missing_directory(self):
+        path = os.path.join(self.tmp.name, "out", "deck.html")
+        Exporter.export(path, "content")
+        with open(path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "content")
+
+    def test_presentation_export_matches_render(self):
+        for count in (0, 1, 3):
+            for auto in (False, True):
+                with self.subTest(slides=count, auto=auto):
+                    pres = Presentation(theme="night", enable_pdf_export=auto)
+                    for index in range(count):
+                        pres.create_slide(f"Slide {index}").add_text("olá <mundo>")
+                    pres.export(self.path, auto=auto)
+                    with open(self.path, encoding="utf-8", newline="") as f:
+                        self.assertEqual(f.read(), pres.render(auto=auto))
+
+    def test_failed_export_keeps_previous_file(self):
+        Exporter.export(self.path, "previous export")
+
+        def chunks():
+            yield "partial"
+            raise RuntimeError("render failed")
+
+        with self.assertRaises(RuntimeError):
+            Exporter.export_stream(self.path, chunks())
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), "previous export")
+        self.assertEqual(os.listdir(self.tmp.name), ["deck.html"])
+
+    def test_presentation_with_bad_slide_keeps_previous_file(self):
+        pres = Presentation()
+        pres.create_slide("Good").add_text("fine")
+        pres.export(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            previous = f.read()
+
+        # A hand-written table payload without rows fails while rendering
+        pres.create_slide("Bad").contents.append(Content(ContentType.TABLE, {"headers": ["a"]}))
+        with self.assertRaises(KeyError):
+            pres.export(self.path)
+        with open(self.path, encoding="utf-8") as f:
+            self.assertEqual(f.read(), previous)
+        self.assertEqual(os.listdir(self.tmp.name), ["deck.html"])
+
+
+if __name__ == "__main__":
+    unittest.main()
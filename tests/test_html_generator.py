@@ -0,0 +1,137 @@
+import unittest
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from revealpy.core.content import Content, ContentType, SlideBuilder
+from revealpy.core.html_generator import HTMLGenerator
+from revealpy.core.layouts import LayoutType
+
+
+def render(content_type, value):
+    return HTMLGenerator.content_to_html(Content(content_type, value))
+
+
+class TestEscaping(unittest.TestCase):
+    def test_text_is_escaped(self):
+        self.assertEqual(render(ContentType.TEXT, "a < b & c"), "<p>a &lt; b &amp; c</p>")
+
+    def test_list_items_are_escaped(self):
+        html = render(ContentType.BULLET_LIST, ["<b>bold</b>"])
+        self.assertIn("<li>&lt;b&gt;bold&lt;/b&gt;</li>", html)
+
+    def test_table_cells_are_escaped(self):
+        html = render(ContentType.TABLE, (["<h>"], [["x & y"]]))
+        self.assertIn("<th>&lt;h&gt;</th>", html)
+        self.assertIn("<td>x &amp; y</td>", html)
+
+    def test_image_caption_is_escaped(self):
+        html = render(ContentType.IMAGE, ("logo.png", 'Logo "<v1>"'))
+        self.assertIn('alt="Logo &quot;&lt;v1&gt;&quot;"', html)
+        self.assertIn('<p>Logo "&lt;v1&gt;"</p>', html)
+
+    def test_quote_is_escaped(self):
+        slide = SlideBuilder("Quote", LayoutType.QUOTE).add_text("<q>").add_text("Me & you")
+        html = HTMLGenerator.generate_slide_html(slide)
+        self.assertIn("&lt;q&gt;", html)
+        self.assertIn("<cite>Me &amp; you</cite>", html)
+
+    def test_markdown_and_code_are_not_escaped(self):
+        self.assertEqual(render(ContentType.MARKDOWN, "<b>md</b>"), "<b>md</b>")
+        self.assertIn("a < b", render(ContentType.CODE, ("a < b", "python")))
+
+
+class TestNonStringValues(unittest.TestCase):
+    def test_text_number(self):
+        self.assertEqual(render(ContentType.TEXT, 42), "<p>42</p>")
+
+    def test_text_none(self):
+        slide = SlideBuilder("None").add_text(None)
+        self.assertEqual(HTMLGenerator.content_to_html(slide.contents[0]), "<p>None</p>")
+
+    def test_image_caption_number(self):
+        self.assertIn("<p>2024</p>", render(ContentType.IMAGE, ("chart.png", 2024)))
+
+    def test_code_language_none_and_numeric_code(self):
+        slide = SlideBuilder("Code").add_code("x = 1", language=None).add_code(123)
+        html = [HTMLGenerator.content_to_html(content) for content in slide.contents]
+        self.assertEqual(html[0], '<pre><code class="language-None">x = 1</code></pre>')
+        self.assertEqual(html[1], '<pre><code class="language-python">123</code></pre>')
+
+    def test_diagram_number(self):
+        slide = SlideBuilder("Diagram").add_diagram(42)
+        self.assertEqual(HTMLGenerator.content_to_html(slide.contents[0]), '<div class="mermaid">42</div>')
+
+    def test_equation_number(self):
+        slide = SlideBuilder("Eq").add_equation(2)
+        self.assertEqual(HTMLGenerator.content_to_html(slide.contents[0]), "<p>$$\n2\n$$</p>\n")
+
+    def test_list_and_table_numbers(self):
+        self.assertIn("<li>1</li>", render(ContentType.NUMBERED_LIST, [1, 2]))
+        self.assertIn("<td>3.5</td>", render(ContentType.TABLE, (["n"], [[3.5]])))
+
+
+class TestUnhashableValues(unittest.TestCase):
+    def test_text_list(self):
+        self.assertEqual(render(ContentType.TEXT, ["a"]), "<p>['a']</p>")
+
+    def test_equation_description_with_list_values(self):
+        slide = SlideBuilder("Eq").add_equation("E = mc^2", {"E": ["energia", "J"]})
+        html = HTMLGenerator.content_to_html(slide.contents[0])
+        self.assertIn("<li><strong>E</strong>: ['energia', 'J']</li>", html)
+
+    def test_repeated_render_matches(self):
+        slide = SlideBuilder("Eq").add_equation("x", {"x": "var"})
+        first = HTMLGenerator.content_to_html(slide.contents[0])
+        self.assertEqual(HTMLGenerator.content_to_html(slide.contents[0]), first)
+
+
+class TestRenderCache(unittest.TestCase):
+    def test_equal_values_of_other_types_are_not_shared(self):
+        self.assertEqual(render(ContentType.TEXT, True), "<p>True</p>")
+        self.assertEqual(render(ContentType.TEXT, 1.0), "<p>1.0</p>")
+        self.assertEqual(render(ContentType.TEXT, 1), "<p>1</p>")
+
+    def test_equation_descriptions_of_other_types_are_not_shared(self):
+        first = HTMLGenerator.content_to_html(SlideBuilder("Eq").add_equation("x", {"x": 1}).contents[0])
+        second = HTMLGenerator.content_to_html(SlideBuilder("Eq").add_equation("x", {"x": 1.0}).contents[0])
+        self.assertIn("<strong>x</strong>: 1</li>", first)
+        self.assertIn("<strong>x</strong>: 1.0</li>", second)
+
+    def test_captions_of_other_types_are_not_shared(self):
+        self.assertIn("<p>1</p>", render(ContentType.IMAGE, ("logo.png", 1)))
+        html = render(ContentType.IMAGE, ("logo.png", True))
+        self.assertIn('alt="True"', html)
+        self.assertIn("<p>True</p>", html)
+
+    def test_render_errors_are_raised_once(self):
+        calls = []
+
+        class Exploding:
+            def __format__(self, spec):
+                calls.append(spec)
+                raise TypeError("cannot format")
+
+        with self.assertRaises(TypeError):
+            render(ContentType.TEXT, Exploding())
+        self.assertEqual(len(calls), 1)
+
+
+@unittest.skipIf(np is None, "numpy is not installed")
+class TestArrayTables(unittest.TestCase):
+    def test_cells_print_like_numpy_scalars(self):
+        for dtype in ("float16", "float32", "float64", "int32", "int64", "bool", "object", "str"):
+            with self.subTest(dtype=dtype):
+                rows = np.array([[0.1, 1], [2.5, 0]]).astype(dtype)
+                expected = render(ContentType.TABLE, (["a", "b"], [list(row) for row in rows]))
+                self.assertEqual(render(ContentType.TABLE, (np.array(["a", "b"]), rows)), expected)
+
+    def test_float32_cells_keep_short_repr(self):
+        html = render(ContentType.TABLE, (["x"], np.array([[0.1]], dtype="float32")))
+        self.assertIn("<td>0.1</td>", html)
+
+
+if __name__ == "__main__":
+    unittest.main()